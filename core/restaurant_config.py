@@ -23,7 +23,11 @@ class DayOfWeek(Enum):
     SUNDAY = 6
 
 
-@dataclass
+# Indexed by date.weekday(); avoids the Enum value lookup on every call
+_DAYS_BY_WEEKDAY = tuple(DayOfWeek)
+
+
+@dataclass(slots=True)
 class TimeRange:
     """Time range with opening and closing times."""
     open_time: time
@@ -33,9 +37,11 @@ class TimeRange:
     @property
     def last_reservation_time(self) -> time:
         """Calculate the last allowed reservation time."""
-        close_dt = datetime.combine(date.today(), self.close_time)
-        last_res_dt = close_dt - timedelta(minutes=self.last_reservation_offset_minutes)
-        return last_res_dt.time()
+        # Wall-clock arithmetic on minute-of-day, wrapping past midnight the
+        # same way subtracting from a datetime would, without date.today()
+        close = self.close_time
+        minutes = (close.hour * 60 + close.minute - self.last_reservation_offset_minutes) % (24 * 60)
+        return time(minutes // 60, minutes % 60, close.second, close.microsecond)
 
     def is_time_within(self, check_time: time) -> bool:
         """Check if a time falls within this range (for reservations)."""
@@ -46,7 +52,7 @@ class TimeRange:
         return self.open_time <= check_time < self.close_time
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecialHours:
     """Special hours for a specific date (holiday, event, etc.)."""
     date: date
@@ -59,7 +65,7 @@ class SpecialHours:
         return self.time_range is None
 
 
-@dataclass
+@dataclass(slots=True)
 class BookingRules:
     """Booking rules and constraints."""
     # Time slot settings
@@ -144,8 +150,8 @@ class RestaurantConfig:
             TimeRange for the date, or None if closed
         """
         # Check special hours first
-        if check_date in self.special_hours:
-            special = self.special_hours[check_date]
+        special = self.special_hours.get(check_date)
+        if special is not None:
             return special.time_range
 
         # Check if explicitly closed
@@ -153,8 +159,7 @@ class RestaurantConfig:
             return None
 
         # Return regular hours for the day of week
-        day_of_week = DayOfWeek(check_date.weekday())
-        return self.regular_hours.get(day_of_week)
+        return self.regular_hours.get(_DAYS_BY_WEEKDAY[check_date.weekday()])
 
     def is_open_on_date(self, check_date: date) -> bool:
         """Check if the restaurant is open on a date."""
@@ -171,10 +176,11 @@ class RestaurantConfig:
             Tuple of (is_valid, error_message)
         """
         # Ensure timezone aware
+        tz = self.tz
         if reservation_dt.tzinfo is None:
-            reservation_dt = self.tz.localize(reservation_dt)
+            reservation_dt = tz.localize(reservation_dt)
         else:
-            reservation_dt = reservation_dt.astimezone(self.tz)
+            reservation_dt = reservation_dt.astimezone(tz)
 
         now = get_current_datetime()
         rules = self.booking_rules
@@ -224,9 +230,12 @@ class RestaurantConfig:
         if duration_minutes is None:
             duration_minutes = rules.default_duration_minutes
 
+        # Resolve the zone once; it is needed for both localize calls
+        tz = self.tz
+
         # Ensure timezone aware
         if reservation_dt.tzinfo is None:
-            reservation_dt = self.tz.localize(reservation_dt)
+            reservation_dt = tz.localize(reservation_dt)
 
         hours = self.get_hours_for_date(reservation_dt.date())
         if hours is None:
@@ -234,8 +243,7 @@ class RestaurantConfig:
 
         # Calculate end time
         end_dt = reservation_dt + timedelta(minutes=duration_minutes)
-        close_dt = datetime.combine(reservation_dt.date(), hours.close_time)
-        close_dt = self.tz.localize(close_dt)
+        close_dt = tz.localize(datetime.combine(reservation_dt.date(), hours.close_time))
 
         if end_dt > close_dt:
             # Calculate maximum possible duration
@@ -1,11 +1,18 @@
 """Graph-based conversation workflow service."""
 
 import json
+import re
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 from enum import Enum
 
 
+# Keyword classes for main-menu routing; plain substring alternation, matching
+# the previous `any(word in text ...)` checks while scanning the input once
+_MENU_KEYWORDS = re.compile(r"menu|food|eat|dish|meal")
+_RESERVATION_KEYWORDS = re.compile(r"reservation|book|table|reserve")
+
+
 class ConversationStep(str, Enum):
     """Conversation step enumeration."""
     GREETING = "greeting"
@@ -105,7 +112,7 @@ class RestaurantBotGraph:
         """Handle main menu selection."""
         user_input_lower = user_input.lower()
 
-        if any(word in user_input_lower for word in ["menu", "food", "eat", "dish", "meal"]):
+        if _MENU_KEYWORDS.search(user_input_lower):
             message = (
                 "Great! I can tell you about our menu. "
                 "We have appetizers, entrees, pasta, pizza, salads, and desserts. "
@@ -117,7 +124,7 @@ class RestaurantBotGraph:
                 "state": state
             }
 
-        elif any(word in user_input_lower for word in ["reservation", "book", "table", "reserve"]):
+        elif _RESERVATION_KEYWORDS.search(user_input_lower):
             message = "Excellent! I'll help you make a reservation. May I have your name, please?"
             return {
                 "next_step": ConversationStep.RESERVATION_NAME,
@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
 )
-from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool, StaticPool
 
 
 # Database URL from environment variable
@@ -24,6 +24,13 @@ if DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
 
+_POOL_CLASSES = {
+    "queue": AsyncAdaptedQueuePool,
+    "static": StaticPool,
+    "null": NullPool,
+}
+
+
 class DatabaseConfig:
     """Database configuration settings."""
 
@@ -33,6 +40,8 @@ class DatabaseConfig:
     POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
     POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
     POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # "queue" (default), "static" (one shared connection) or "null" (no pooling)
+    POOL_CLASS: str = os.getenv("DB_POOL_CLASS", "queue").lower()
 
     # Query settings
     ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
@@ -53,6 +62,7 @@ def create_engine(
     pool_size: int = DatabaseConfig.POOL_SIZE,
     max_overflow: int = DatabaseConfig.MAX_OVERFLOW,
     echo: bool = DatabaseConfig.ECHO,
+    pool_class: str = DatabaseConfig.POOL_CLASS,
 ) -> AsyncEngine:
     """
     Create async SQLAlchemy engine.
@@ -62,21 +72,35 @@ def create_engine(
         pool_size: Number of connections to maintain in pool
         max_overflow: Max number of connections to create beyond pool_size
         echo: Whether to log all SQL statements
+        pool_class: Pool implementation: "queue", "static" or "null"
 
     Returns:
         Async SQLAlchemy engine
+
+    Raises:
+        ValueError: If pool_class is not a known pool name
     """
+    if pool_class not in _POOL_CLASSES:
+        raise ValueError(f"Unknown DB pool class: {pool_class}")
+
+    pool_kwargs = {}
+    if pool_class == "queue":
+        # Sizing options only apply to the queue pool
+        pool_kwargs = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": DatabaseConfig.POOL_TIMEOUT,
+            "pool_recycle": DatabaseConfig.POOL_RECYCLE,
+        }
+
     return create_async_engine(
         url,
         echo=echo,
         echo_pool=DatabaseConfig.ECHO_POOL,
-        poolclass=AsyncAdaptedQueuePool,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        pool_timeout=DatabaseConfig.POOL_TIMEOUT,
-        pool_recycle=DatabaseConfig.POOL_RECYCLE,
+        poolclass=_POOL_CLASSES[pool_class],
         pool_pre_ping=DatabaseConfig.POOL_PRE_PING,
         connect_args=DatabaseConfig.CONNECT_ARGS,
+        **pool_kwargs,
     )
 
 
@@ -632,14 +632,13 @@ class ReservationService:
         start_hour = 11
         end_hour = 21  # Last reservation at 21:00 (gives 2 hours until closing)
 
-        # Ensure date is in correct timezone
-        if date.tzinfo is None:
-            date = TIMEZONE.localize(date)
-        else:
+        # Local calendar day of the requested date
+        if date.tzinfo is not None:
             date = date.astimezone(TIMEZONE)
 
-        # Start from the given date at opening time
-        check_date = date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+        # Start from that day at opening time, localized once so the UTC
+        # offset is the one in effect at opening rather than at the input time
+        check_date = TIMEZONE.localize(datetime.combine(date.date(), time(start_hour)))
 
         # Limit search to specified duration
         end_search = check_date + timedelta(hours=duration_hours)
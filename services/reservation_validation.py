@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, date, time, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Set
 from enum import Enum
+from functools import lru_cache
 
 from core.utils_datetime import TIMEZONE, get_current_datetime
 from core.restaurant_config import (
@@ -43,7 +44,7 @@ class ValidationCategory(Enum):
     AVAILABILITY = "availability"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Represents a validation error or warning."""
     category: ValidationCategory
@@ -54,7 +55,7 @@ class ValidationError:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation with all errors and warnings."""
     is_valid: bool
@@ -101,13 +102,21 @@ SLOVAK_MOBILE_PREFIXES = {'90', '91', '92', '93', '94', '95', '96', '97', '98',
 
 # Invalid/suspicious patterns
 INVALID_PHONE_PATTERNS = [
-    r'^(\+?0+)$',  # All zeros
-    r'^(\d)\1{6,}$',  # Same digit repeated 7+ times
-    r'^1234567',  # Sequential digits
-    r'^0000000',  # Leading zeros
-    r'^\+0',  # Plus followed by zero
+    re.compile(r'^(\+?0+)$'),  # All zeros
+    re.compile(r'^(\d)\1{6,}$'),  # Same digit repeated 7+ times
+    re.compile(r'^1234567'),  # Sequential digits
+    re.compile(r'^0000000'),  # Leading zeros
+    re.compile(r'^\+0'),  # Plus followed by zero
 ]
 
+# Whitespace and separators people type between phone digits
+PHONE_SEPARATORS = re.compile(r'[\s\-\.\(\)\[\]]')
+
+# Scheme-like prefixes copied from contact cards and links
+PHONE_PREFIXES = re.compile(r'^(tel:|phone:|mob:|mobile:)', re.IGNORECASE)
+
+NON_DIGITS = re.compile(r'[^\d]')
+
 
 def normalize_phone_to_e164(
     phone: str,
@@ -128,12 +137,46 @@ def normalize_phone_to_e164(
     if not phone:
         return None, phone if keep_raw else None, "Phone number is required"
 
-    raw_input = phone
+    normalized, error = _normalize_phone(phone, default_country_code)
+    return normalized, phone if keep_raw else None, error
+
+
+@lru_cache(maxsize=1024)
+def _normalize_phone(
+    phone: str,
+    default_country_code: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Normalize a non-empty phone number to E.164.
+
+    Callers retry with the same number in the same format, so results are
+    memoized per (phone, country code).
+
+    Args:
+        phone: Raw phone number input
+        default_country_code: Default country code to apply
+
+    Returns:
+        Tuple of (normalized_phone, error_message)
+    """
     # Remove all whitespace and common separators
-    cleaned = re.sub(r'[\s\-\.\(\)\[\]]', '', phone)
+    cleaned = PHONE_SEPARATORS.sub('', phone)
+
+    # Fast path for the dominant Slovak formats; every branch below would
+    # produce the same result and none of the invalid patterns can match
+    # a number starting with 421
+    if cleaned.isascii():
+        if cleaned.isdigit():
+            if (len(cleaned) == 10 and cleaned[0] == '0' and cleaned[1] != '0'
+                    and default_country_code == SLOVAK_COUNTRY_CODE):
+                return SLOVAK_COUNTRY_CODE + cleaned[1:], None
+            if len(cleaned) == 12 and cleaned.startswith('421'):
+                return '+' + cleaned, None
+        elif len(cleaned) == 13 and cleaned.startswith('+421') and cleaned[1:].isdigit():
+            return cleaned, None
 
     # Remove common prefixes like "tel:", "phone:"
-    cleaned = re.sub(r'^(tel:|phone:|mob:|mobile:)', '', cleaned, flags=re.IGNORECASE)
+    cleaned = PHONE_PREFIXES.sub('', cleaned)
 
     # Handle 00 prefix (European international format)
     if cleaned.startswith('00'):
@@ -158,25 +201,23 @@ def normalize_phone_to_e164(
 
     # Final cleanup - only digits and leading +
     if cleaned.startswith('+'):
-        digits = re.sub(r'[^\d]', '', cleaned[1:])
+        digits = NON_DIGITS.sub('', cleaned[1:])
         cleaned = '+' + digits
     else:
-        digits = re.sub(r'[^\d]', '', cleaned)
+        digits = NON_DIGITS.sub('', cleaned)
         cleaned = '+' + digits
 
     # Validate the result
-    raw_result = raw_input if keep_raw else None
-
     if not E164_PATTERN.match(cleaned):
-        return None, raw_result, f"Invalid phone format: must be E.164 (got {cleaned})"
+        return None, f"Invalid phone format: must be E.164 (got {cleaned})"
 
     # Check for suspicious patterns
     digits_only = cleaned[1:]  # Remove +
     for pattern in INVALID_PHONE_PATTERNS:
-        if re.match(pattern, digits_only):
-            return None, raw_result, "Phone number appears to be invalid"
+        if pattern.match(digits_only):
+            return None, "Phone number appears to be invalid"
 
-    return cleaned, raw_result, None
+    return cleaned, None
 
 
 def validate_phone_strict(phone: str) -> Tuple[bool, Optional[str]]:
@@ -204,7 +245,7 @@ def validate_phone_strict(phone: str) -> Tuple[bool, Optional[str]]:
 
     # Check for suspicious patterns
     for pattern in INVALID_PHONE_PATTERNS:
-        if re.match(pattern, digits):
+        if pattern.match(digits):
             return False, "Phone number appears to be invalid"
 
     return True, None
@@ -216,22 +257,39 @@ def validate_phone_strict(phone: str) -> Tuple[bool, Optional[str]]:
 
 # Invalid name patterns
 INVALID_NAME_PATTERNS = [
-    r'^[0-9\s\-\.]+$',  # Only digits and punctuation
-    r'^\s*$',  # Empty or whitespace only
-    r'^(.)\1{3,}$',  # Same character repeated 4+ times
-    r'^test\s*(user|name)?$',  # Test entries
-    r'^xxx+$',  # Placeholder patterns
-    r'^n/?a$',  # N/A entries
-    r'^none$',  # None entries
-    r'^unknown$',  # Unknown entries
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'^[0-9\s\-\.]+$',  # Only digits and punctuation
+        r'^\s*$',  # Empty or whitespace only
+        r'^(.)\1{3,}$',  # Same character repeated 4+ times
+        r'^test\s*(user|name)?$',  # Test entries
+        r'^xxx+$',  # Placeholder patterns
+        r'^n/?a$',  # N/A entries
+        r'^none$',  # None entries
+        r'^unknown$',  # Unknown entries
+    )
 ]
 
-# Characters to remove from names
-NAME_INVALID_CHARS = re.compile(r'[<>{}|\[\]\\^`~@#$%&*+=]')
+# Characters to remove from names, as a str.translate deletion table
+NAME_INVALID_CHARS = str.maketrans('', '', '<>{}|[]\\^`~@#$%&*+=')
 
 # Multiple whitespace pattern
 MULTIPLE_WHITESPACE = re.compile(r'\s+')
 
+# Three or more consecutive newlines
+MULTIPLE_NEWLINES = re.compile(r'\n{3,}')
+
+# Potentially dangerous notes content (basic XSS prevention) and its replacement
+DANGEROUS_NOTES_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE | re.DOTALL), replacement)
+    for pattern, replacement in (
+        (r'<script[^>]*>.*?</script>', '[removed]'),
+        (r'<[^>]+>', ''),  # Remove HTML tags
+        (r'javascript:', ''),
+        (r'on\w+\s*=', ''),  # Event handlers
+    )
+]
+
 
 def sanitize_name(name: str, max_length: int = 100) -> Tuple[str, List[str]]:
     """
@@ -249,25 +307,18 @@ def sanitize_name(name: str, max_length: int = 100) -> Tuple[str, List[str]]:
     if not name:
         return "", ["Name is empty"]
 
-    # Trim whitespace
-    sanitized = name.strip()
-
     # Remove invalid characters
-    original = sanitized
-    sanitized = NAME_INVALID_CHARS.sub('', sanitized)
-    if sanitized != original:
+    sanitized = name.translate(NAME_INVALID_CHARS)
+    if len(sanitized) != len(name):
         warnings.append("Invalid characters were removed from name")
 
-    # Collapse multiple whitespace
-    sanitized = MULTIPLE_WHITESPACE.sub(' ', sanitized)
-
-    # Trim again after cleanup
-    sanitized = sanitized.strip()
+    # Trim and collapse multiple whitespace in one pass
+    sanitized = ' '.join(sanitized.split())
 
     # Check for invalid patterns
     name_lower = sanitized.lower()
     for pattern in INVALID_NAME_PATTERNS:
-        if re.match(pattern, name_lower, re.IGNORECASE):
+        if pattern.match(name_lower):
             warnings.append(f"Name appears to be invalid or placeholder")
             break
 
@@ -302,23 +353,16 @@ def sanitize_notes(notes: Optional[str], max_length: int = 500) -> Tuple[Optiona
         return None, []
 
     # Remove potentially dangerous patterns (basic XSS prevention)
-    dangerous_patterns = [
-        (r'<script[^>]*>.*?</script>', '[removed]'),
-        (r'<[^>]+>', ''),  # Remove HTML tags
-        (r'javascript:', ''),
-        (r'on\w+\s*=', ''),  # Event handlers
-    ]
-
     original = sanitized
-    for pattern, replacement in dangerous_patterns:
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE | re.DOTALL)
+    for pattern, replacement in DANGEROUS_NOTES_PATTERNS:
+        sanitized = pattern.sub(replacement, sanitized)
 
     if sanitized != original:
         warnings.append("Potentially unsafe content was removed from notes")
 
     # Collapse multiple whitespace and newlines
     sanitized = MULTIPLE_WHITESPACE.sub(' ', sanitized)
-    sanitized = re.sub(r'\n{3,}', '\n\n', sanitized)
+    sanitized = MULTIPLE_NEWLINES.sub('\n\n', sanitized)
 
     # Trim again
     sanitized = sanitized.strip()
@@ -643,9 +687,11 @@ def validate_cross_field_rules(
             ))
             result.requires_manual_confirmation = True
 
+    reservation_date = reservation_dt.date()
+
     # Check for holiday/special date
-    if reservation_dt.date() in config.special_hours:
-        special = config.special_hours[reservation_dt.date()]
+    special = config.special_hours.get(reservation_date)
+    if special is not None:
         if special.description:
             result.add_error(ValidationError(
                 category=ValidationCategory.CROSS_FIELD,
@@ -656,8 +702,12 @@ def validate_cross_field_rules(
                 details={"description": special.description}
             ))
 
+    # The remaining rules only apply to larger parties; skip the clock read
+    if party_size < 6:
+        return result
+
     # Weekend large party warning
-    if reservation_dt.weekday() >= 5 and party_size >= 6:  # Saturday/Sunday
+    if reservation_dt.weekday() >= 5:  # Saturday/Sunday
         result.add_error(ValidationError(
             category=ValidationCategory.CROSS_FIELD,
             severity=ValidationSeverity.INFO,
@@ -668,7 +718,7 @@ def validate_cross_field_rules(
 
     # Same-day large party requires extra lead time
     now = get_current_datetime()
-    if reservation_dt.date() == now.date() and party_size >= 6:
+    if reservation_date == now.date():
         hours_until = (reservation_dt - now).total_seconds() / 3600
         if hours_until < 4:
             result.add_error(ValidationError(
@@ -702,9 +752,11 @@ def generate_reservation_hash(
     Returns:
         Hash string for idempotency checking
     """
-    # Create a unique key from the key fields
-    key_string = f"{phone}|{reservation_dt.isoformat()}|{party_size}"
-    return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+    # Hashes are persisted in reservations.idempotency_hash, so the algorithm
+    # and key format must stay stable. Hash the joined key in one call and hex
+    # only the 8 bytes we keep instead of the full 32-byte digest.
+    key = f"{phone}|{reservation_dt.isoformat()}|{party_size}".encode()
+    return hashlib.sha256(key).digest()[:8].hex()
 
 
 def check_idempotency(
@@ -727,6 +779,10 @@ def check_idempotency(
     Returns:
         Tuple of (is_duplicate, duplicate_hash)
     """
+    # Nothing registered yet, so skip hashing the candidate times
+    if not existing_hashes:
+        return False, None
+
     # Check exact match
     exact_hash = generate_reservation_hash(phone, reservation_dt, party_size)
     if exact_hash in existing_hashes:
@@ -748,7 +804,7 @@ def check_idempotency(
 # Complete Reservation Validation
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ReservationInput:
     """Input data for reservation validation."""
     name: str
@@ -760,7 +816,7 @@ class ReservationInput:
     duration_minutes: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatedReservation:
     """Validated and normalized reservation data."""
     name: str
@@ -0,0 +1,61 @@
+"""
+Parsers for the numeric slots collected by the reservation flow.
+
+Each helper runs once per user turn, so the patterns are compiled at import
+time and the helpers return plain values instead of match objects.
+"""
+import re
+from typing import Optional, Tuple
+
+
+# Every byte except ASCII digits and '+', for bytes.translate to delete
+_NON_PHONE_BYTES = bytes(c for c in range(256) if chr(c) not in '0123456789+')
+_NUMBER = re.compile(r'\d+')
+_TIME = re.compile(r'(\d{1,2})[:\.](\d{2})')
+
+
+def parse_phone(text: str) -> str:
+    """
+    Strip everything except digits and '+' from a spoken phone number.
+
+    Args:
+        text: Raw user message
+
+    Returns:
+        Phone characters only (may be empty)
+    """
+    # Non-ASCII characters can never be phone characters, so drop them in the
+    # encode and let bytes.translate delete the rest in C
+    return text.encode('ascii', 'ignore').translate(None, _NON_PHONE_BYTES).decode('ascii')
+
+
+def parse_int(text: str) -> Optional[int]:
+    """
+    Extract the first number from a user message (party size, list selection).
+
+    Args:
+        text: Raw user message
+
+    Returns:
+        Parsed number or None if the message contains no digits
+    """
+    match = _NUMBER.search(text)
+    if match is None:
+        return None
+    return int(match.group())
+
+
+def parse_time(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Extract a time given as HH:MM or HH.MM.
+
+    Args:
+        text: Raw user message
+
+    Returns:
+        (hour, minute) tuple or None if no time was found
+    """
+    match = _TIME.search(text)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
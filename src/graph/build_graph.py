@@ -5,8 +5,9 @@ Defines the workflow with nodes and conditional edges for routing.
 from typing import Literal
 from langgraph.graph import StateGraph, END
 import logging
+import threading
 
-from src.graph.state import CallState
+from src.graph.state import CallState, Step
 from src.graph.nodes import (
     detect_intent_node,
     menu_answer_node,
@@ -62,9 +63,9 @@ def route_from_reserve_collect(state: CallState) -> str:
     Returns:
         Next node name
     """
-    if state.current_step == "handoff":
+    if state.current_step == Step.HANDOFF:
         return "handoff"
-    elif state.current_step == "reserve_confirm":
+    elif state.current_step == Step.RESERVE_CONFIRM:
         return "reserve_confirm"
     else:
         # Stay in collect until all slots filled
@@ -81,9 +82,9 @@ def route_from_reserve_confirm(state: CallState) -> str:
     Returns:
         Next node name
     """
-    if state.current_step == "reserve_execute":
+    if state.current_step == Step.RESERVE_EXECUTE:
         return "reserve_execute"
-    elif state.current_step == "reserve_collect":
+    elif state.current_step == Step.RESERVE_COLLECT:
         # User said no, restart collection
         return "reserve_collect"
     else:
@@ -103,10 +104,10 @@ def route_from_reserve_execute(state: CallState) -> str:
     """
     if state.is_complete:
         return END
-    elif state.current_step == "reserve_collect_date":
+    elif state.current_step == Step.RESERVE_COLLECT_DATE:
         # Need to retry date/time
         return "reserve_collect"
-    elif state.current_step == "error":
+    elif state.current_step == Step.ERROR:
         return "handoff"
     else:
         return END
@@ -122,9 +123,9 @@ def route_from_cancel_collect(state: CallState) -> str:
     Returns:
         Next node name
     """
-    if state.current_step == "handoff":
+    if state.current_step == Step.HANDOFF:
         return "handoff"
-    elif state.current_step == "cancel_search":
+    elif state.current_step == Step.CANCEL_SEARCH:
         return "cancel_search"
     else:
         # Stay in collect until all 3 questions answered
@@ -144,13 +145,13 @@ def route_from_cancel_search(state: CallState) -> str:
     if state.is_complete:
         # No reservations found
         return END
-    elif state.current_step == "cancel_confirm":
+    elif state.current_step == Step.CANCEL_CONFIRM:
         # Exactly one reservation found
         return "cancel_confirm"
-    elif state.current_step == "cancel_disambiguate":
+    elif state.current_step == Step.CANCEL_DISAMBIGUATE:
         # Multiple reservations found
         return "cancel_disambiguate"
-    elif state.current_step == "error":
+    elif state.current_step == Step.ERROR:
         return "handoff"
     else:
         return END
@@ -166,9 +167,9 @@ def route_from_cancel_disambiguate(state: CallState) -> str:
     Returns:
         Next node name
     """
-    if state.current_step == "handoff":
+    if state.current_step == Step.HANDOFF:
         return "handoff"
-    elif state.current_step == "cancel_confirm":
+    elif state.current_step == Step.CANCEL_CONFIRM:
         return "cancel_confirm"
     else:
         # Stay in disambiguate until user selects
@@ -185,7 +186,7 @@ def route_from_cancel_confirm(state: CallState) -> str:
     Returns:
         Next node name or END
     """
-    if state.current_step == "cancel_execute":
+    if state.current_step == Step.CANCEL_EXECUTE:
         return "cancel_execute"
     elif state.is_complete:
         # User declined cancellation
@@ -359,12 +360,25 @@ def build_restaurant_bot_graph() -> StateGraph:
     return compiled_graph
 
 
+# Compiled graph singleton; the graph holds no per-call state
+_restaurant_bot_graph_instance = None
+_restaurant_bot_graph_lock = threading.Lock()
+
+
 # Convenience function for getting a ready-to-use graph
 def get_restaurant_bot_graph() -> StateGraph:
     """
-    Get a compiled restaurant bot graph.
+    Get the compiled restaurant bot graph, compiling it on first use.
 
     Returns:
         Compiled StateGraph
     """
-    return build_restaurant_bot_graph()
+    global _restaurant_bot_graph_instance
+
+    if _restaurant_bot_graph_instance is None:
+        # Concurrent first calls must not each compile their own graph
+        with _restaurant_bot_graph_lock:
+            if _restaurant_bot_graph_instance is None:
+                _restaurant_bot_graph_instance = build_restaurant_bot_graph()
+
+    return _restaurant_bot_graph_instance
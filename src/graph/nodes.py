@@ -3,21 +3,91 @@ Node functions for the restaurant bot LangGraph orchestration.
 Includes intent detection, menu queries, recommendations, reservations, and cancellations.
 """
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Dict, Any
 import logging
 
-from src.graph.state import CallState
+from src.graph.state import CallState, Step
+from src.graph._fast_parse import parse_int, parse_phone, parse_time
 from services.reservation_service import ReservationService, get_reservation_service
+from services.reservation_validation import normalize_phone_to_e164
 from services.menu_service import MenuService, get_menu_service
 from services.recommender_service import RecommenderService, get_recommender_service
 from core.utils_datetime import TIMEZONE
 
 logger = logging.getLogger(__name__)
 
+# Fixed bot prompts
+_WELCOME = "Добро пожаловать в ресторан HuntVoice! Как я могу вам помочь?"
+_UNKNOWN_PROMPT = (
+    "Извините, я не совсем понял. Вы хотите забронировать столик, отменить бронь, "
+    "узнать о меню или получить рекомендации?"
+)
+_HANDOFF_MSG = (
+    "Сейчас я переведу вас на нашего сотрудника, который сможет лучше помочь. "
+    "Пожалуйста, подождите..."
+)
+_YES_NO_PROMPT = "Пожалуйста, ответьте 'да' или 'нет'."
+_MENU_ERROR_MSG = "Извините, произошла ошибка при получении меню. Могу я помочь вам с чем-то еще?"
+
 
 # ==================== Intent Detection ====================
 
+# Intent patterns (regex-based), in priority order
+_INTENT_PATTERNS = {
+    "RESERVE": [
+        r"\b(забронировать|бронь|бронирование|резерв|столик|reserve|book|table)\b",
+        r"\b(хочу|нужен|можно)\s+(столик|стол|место)\b",
+    ],
+    "CANCEL": [
+        r"\b(отменить|отмена|cancel|remove|delete)\b",
+        r"\b(удалить|убрать)\s+(бронь|бронирование|reservation)\b",
+    ],
+    "MENU": [
+        r"\b(меню|menu|что\s+есть|блюда|еда|food|dishes)\b",
+        r"\b(что\s+у\s+вас|какие\s+блюда|что\s+можно)\b",
+    ],
+    "RECOMMEND": [
+        r"\b(посоветуй|посоветовать|рекомендуй|рекомендовать|recommend|suggest)\b",
+        r"\b(что\s+лучше|что\s+взять|что\s+заказать)\b",
+        r"\b(специальное|special|chef|шеф)\b",
+    ],
+    "HANDOFF": [
+        r"\b(оператор|человек|сотрудник|operator|human|person|agent)\b",
+        r"\b(не\s+понимаю|не\s+работает|проблема|complaint)\b",
+    ],
+}
+
+# Flattened (compiled pattern, intent) table preserving the priority order above
+_INTENT_TABLE = tuple(
+    (re.compile(pattern), intent)
+    for intent, pattern_list in _INTENT_PATTERNS.items()
+    for pattern in pattern_list
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_intent(user_message: str) -> str:
+    """
+    Classify a lowercased message against _INTENT_TABLE.
+
+    Voice callers mostly answer with the same short commands ("меню",
+    "забронировать", "отменить"), so results are memoized per message.
+
+    Args:
+        user_message: Lowercased user message
+
+    Returns:
+        Detected intent, or "UNKNOWN"
+    """
+    # Single pass over the flat table; first hit in priority order wins
+    for pattern, intent in _INTENT_TABLE:
+        if pattern.search(user_message):
+            return intent
+    return "UNKNOWN"
+
+
 def detect_intent_node(state: CallState) -> CallState:
     """
     Detect user intent using rule-based regex logic.
@@ -32,75 +102,38 @@ def detect_intent_node(state: CallState) -> CallState:
     """
     if not state.messages:
         state.current_intent = "UNKNOWN"
-        state.last_bot_message = "Добро пожаловать в ресторан HuntVoice! Как я могу вам помочь?"
-        state.current_step = "detect_intent"
+        state.last_bot_message = _WELCOME
+        state.current_step = Step.DETECT_INTENT
         return state
 
     # Get the last user message
     user_message = state.messages[-1].lower()
 
-    # Intent patterns (regex-based)
-    patterns = {
-        "RESERVE": [
-            r"\b(забронировать|бронь|бронирование|резерв|столик|reserve|book|table)\b",
-            r"\b(хочу|нужен|можно)\s+(столик|стол|место)\b",
-        ],
-        "CANCEL": [
-            r"\b(отменить|отмена|cancel|remove|delete)\b",
-            r"\b(удалить|убрать)\s+(бронь|бронирование|reservation)\b",
-        ],
-        "MENU": [
-            r"\b(меню|menu|что\s+есть|блюда|еда|food|dishes)\b",
-            r"\b(что\s+у\s+вас|какие\s+блюда|что\s+можно)\b",
-        ],
-        "RECOMMEND": [
-            r"\b(посоветуй|посоветовать|рекомендуй|рекомендовать|recommend|suggest)\b",
-            r"\b(что\s+лучше|что\s+взять|что\s+заказать)\b",
-            r"\b(специальное|special|chef|шеф)\b",
-        ],
-        "HANDOFF": [
-            r"\b(оператор|человек|сотрудник|operator|human|person|agent)\b",
-            r"\b(не\s+понимаю|не\s+работает|проблема|complaint)\b",
-        ],
-    }
-
-    # Check each intent pattern
-    detected_intent = "UNKNOWN"
-    for intent, pattern_list in patterns.items():
-        for pattern in pattern_list:
-            if re.search(pattern, user_message):
-                detected_intent = intent
-                break
-        if detected_intent != "UNKNOWN":
-            break
-
+    detected_intent = _classify_intent(user_message)
     state.current_intent = detected_intent
 
     # Set appropriate next step based on intent
     if detected_intent == "MENU":
-        state.current_step = "menu_answer"
+        state.current_step = Step.MENU_ANSWER
         state.last_bot_message = None  # Will be set by menu_answer_node
     elif detected_intent == "RECOMMEND":
-        state.current_step = "recommend"
+        state.current_step = Step.RECOMMEND
         state.last_bot_message = None  # Will be set by recommend_node
     elif detected_intent == "RESERVE":
-        state.current_step = "reserve_collect"
+        state.current_step = Step.RESERVE_COLLECT
         state.last_bot_message = "Отлично! Давайте забронируем столик. Как вас зовут?"
     elif detected_intent == "CANCEL":
-        state.current_step = "cancel_collect_name"
+        state.current_step = Step.CANCEL_COLLECT_NAME
         state.last_bot_message = "Я помогу отменить бронирование. Скажите, пожалуйста, на чье имя бронь?"
     elif detected_intent == "HANDOFF":
-        state.current_step = "handoff"
+        state.current_step = Step.HANDOFF
         state.handoff_reason = "User requested human operator"
     else:
-        state.current_step = "detect_intent"
-        state.last_bot_message = (
-            "Извините, я не совсем понял. Вы хотите забронировать столик, отменить бронь, "
-            "узнать о меню или получить рекомендации?"
-        )
+        state.current_step = Step.DETECT_INTENT
+        state.last_bot_message = _UNKNOWN_PROMPT
         state.error_count += 1
 
-    logger.info(f"Detected intent: {detected_intent}")
+    logger.info("Detected intent: %s", detected_intent)
     return state
 
 
@@ -130,14 +163,14 @@ def menu_answer_node(state: CallState) -> CallState:
             f"Цены от {summary['price_range']['min']:.0f} до {summary['price_range']['max']:.0f} рублей. "
             f"Хотите узнать подробнее о какой-то категории или получить рекомендации?"
         )
-        state.current_step = "menu_answered"
+        state.current_step = Step.MENU_ANSWERED
         state.is_complete = True
 
     except Exception as e:
-        logger.error(f"Error in menu_answer_node: {e}")
-        state.last_bot_message = "Извините, произошла ошибка при получении меню. Могу я помочь вам с чем-то еще?"
+        logger.error("Error in menu_answer_node: %s", e)
+        state.last_bot_message = _MENU_ERROR_MSG
         state.error_count += 1
-        state.current_step = "error"
+        state.current_step = Step.ERROR
 
     return state
 
@@ -170,32 +203,179 @@ def recommend_node(state: CallState) -> CallState:
                 for item in recommendations
             ]
 
-            items_text = "\n".join([
-                f"- {item['name']} ({item['price']:.0f} руб)"
-                for item in recommendations
+            state.last_bot_message = "\n".join([
+                "Рекомендую попробовать наши специальные блюда:",
+                *(f"- {item['name']} ({item['price']:.0f} руб)" for item in recommendations),
+                "Хотите забронировать столик?",
             ])
-
-            state.last_bot_message = (
-                f"Рекомендую попробовать наши специальные блюда:\n{items_text}\n"
-                f"Хотите забронировать столик?"
-            )
         else:
             state.last_bot_message = "К сожалению, сейчас нет доступных рекомендаций. Могу помочь с бронированием?"
 
-        state.current_step = "recommend_done"
+        state.current_step = Step.RECOMMEND_DONE
         state.is_complete = True
 
     except Exception as e:
-        logger.error(f"Error in recommend_node: {e}")
+        logger.error("Error in recommend_node: %s", e)
         state.last_bot_message = "Извините, произошла ошибка. Могу помочь с бронированием столика?"
         state.error_count += 1
-        state.current_step = "error"
+        state.current_step = Step.ERROR
 
     return state
 
 
 # ==================== Make Reservation ====================
 
+def _collect_name(state: CallState, user_message: str) -> CallState:
+    """Store the customer name and ask for a phone number."""
+    state.customer_name = user_message.strip()
+    state.last_bot_message = f"Приятно познакомиться, {state.customer_name}! Какой у вас номер телефона?"
+    state.current_step = Step.RESERVE_COLLECT_PHONE
+    return state
+
+
+def _collect_phone(state: CallState, user_message: str) -> CallState:
+    """Parse and store the phone number."""
+    phone = parse_phone(user_message)
+    if len(phone) >= 10:
+        state.phone_number = phone
+        state.last_bot_message = "Спасибо! Сколько человек будет?"
+        state.current_step = Step.RESERVE_COLLECT_PARTY
+    else:
+        attempts = state.increment_attempt("phone")
+        if state.should_handoff("phone"):
+            state.current_step = Step.HANDOFF
+            state.handoff_reason = "Failed to collect phone number"
+        else:
+            state.last_bot_message = "Пожалуйста, укажите корректный номер телефона (минимум 10 цифр)."
+    return state
+
+
+def _collect_party_size(state: CallState, user_message: str) -> CallState:
+    """Parse and store the party size (1-20)."""
+    try:
+        party_size = parse_int(user_message)
+        if party_size is not None:
+            if 1 <= party_size <= 20:
+                state.party_size = party_size
+                state.last_bot_message = "Отлично! На какую дату бронируем? (например, 2024-12-30 или завтра)"
+                state.current_step = Step.RESERVE_COLLECT_DATE
+            else:
+                state.last_bot_message = "Мы можем принять группы от 1 до 20 человек. Сколько вас будет?"
+        else:
+            raise ValueError("No number found")
+    except (ValueError, AttributeError):
+        attempts = state.increment_attempt("party_size")
+        if state.should_handoff("party_size"):
+            state.current_step = Step.HANDOFF
+            state.handoff_reason = "Failed to collect party size"
+        else:
+            state.last_bot_message = "Пожалуйста, укажите количество гостей числом."
+    return state
+
+
+def _collect_date(state: CallState, user_message: str) -> CallState:
+    """Parse the date and offer available time slots."""
+    try:
+        # Parse date from user input
+        date_str = user_message.strip().lower()
+
+        if "завтра" in date_str or "tomorrow" in date_str:
+            target_date = datetime.now(TIMEZONE) + timedelta(days=1)
+        elif "сегодня" in date_str or "today" in date_str:
+            target_date = datetime.now(TIMEZONE)
+        else:
+            # Try to parse ISO format (YYYY-MM-DD)
+            target_date = TIMEZONE.localize(
+                datetime.combine(date.fromisoformat(date_str.split()[0]), time.min)
+            )
+
+        state.reservation_date = target_date.date().isoformat()
+
+        # Find available slots
+        reservation_service = get_reservation_service()
+        available = reservation_service.find_availability(target_date, state.party_size)
+
+        if available:
+            state.available_slots = available[:5]  # Top 5 slots
+            times = ", ".join([slot['time'] for slot in state.available_slots])
+            state.last_bot_message = (
+                f"На {state.reservation_date} есть свободные места в: {times}. "
+                f"Какое время вам удобно?"
+            )
+            state.current_step = Step.RESERVE_COLLECT_TIME
+        else:
+            state.last_bot_message = (
+                f"К сожалению, на {state.reservation_date} нет свободных мест. "
+                f"Попробуйте другую дату?"
+            )
+            state.reservation_date = None
+
+    except Exception as e:
+        logger.error("Date parsing error: %s", e)
+        attempts = state.increment_attempt("date")
+        if state.should_handoff("date"):
+            state.current_step = Step.HANDOFF
+            state.handoff_reason = "Failed to collect date"
+        else:
+            state.last_bot_message = "Пожалуйста, укажите дату в формате YYYY-MM-DD или скажите 'завтра'."
+    return state
+
+
+def _collect_time(state: CallState, user_message: str) -> CallState:
+    """Parse the time or match it against the offered slots."""
+    try:
+        time_str = user_message.strip()
+
+        # Offered slots keyed by "HH:MM"; each already carries a localized datetime
+        slots_by_time = {slot['time']: slot for slot in state.available_slots}
+
+        # Try to find time in HH:MM format
+        parsed_time = parse_time(time_str)
+        if parsed_time is not None:
+            hour, minute = parsed_time
+            state.reservation_time = f"{hour:02d}:{minute:02d}"
+        else:
+            # Check if it matches one of the available slots
+            for slot_time in slots_by_time:
+                if slot_time in time_str:
+                    state.reservation_time = slot_time
+                    break
+
+        if state.reservation_time:
+            slot = slots_by_time.get(state.reservation_time)
+            if slot is not None and isinstance(slot.get('datetime'), datetime):
+                state.reservation_datetime = slot['datetime']
+            else:
+                state.reservation_datetime = TIMEZONE.localize(
+                    datetime.fromisoformat(f"{state.reservation_date} {state.reservation_time}")
+                )
+            state.current_step = Step.RESERVE_CONFIRM
+            state.needs_confirmation = True
+            state.confirmation_pending_for = "reservation"
+            # Will be handled by confirm node
+        else:
+            raise ValueError("Time not found")
+
+    except (ValueError, AttributeError):
+        attempts = state.increment_attempt("time")
+        if state.should_handoff("time"):
+            state.current_step = Step.HANDOFF
+            state.handoff_reason = "Failed to collect time"
+        else:
+            state.last_bot_message = "Пожалуйста, укажите время в формате ЧЧ:ММ или выберите из предложенных."
+    return state
+
+
+# current_step -> (slot that must still be empty, handler)
+_COLLECT_HANDLERS = {
+    Step.RESERVE_COLLECT: ("customer_name", _collect_name),
+    Step.RESERVE_COLLECT_PHONE: ("phone_number", _collect_phone),
+    Step.RESERVE_COLLECT_PARTY: ("party_size", _collect_party_size),
+    Step.RESERVE_COLLECT_DATE: ("reservation_date", _collect_date),
+    Step.RESERVE_COLLECT_TIME: ("reservation_time", _collect_time),
+}
+
+
 def make_reservation_collect_node(state: CallState) -> CallState:
     """
     Collect reservation information step-by-step.
@@ -211,137 +391,15 @@ def make_reservation_collect_node(state: CallState) -> CallState:
     if not state.messages:
         return state
 
-    user_message = state.messages[-1]
-
-    # Collect name
-    if state.current_step == "reserve_collect" and not state.customer_name:
-        state.customer_name = user_message.strip()
-        state.last_bot_message = f"Приятно познакомиться, {state.customer_name}! Какой у вас номер телефона?"
-        state.current_step = "reserve_collect_phone"
-        return state
-
-    # Collect phone
-    if state.current_step == "reserve_collect_phone" and not state.phone_number:
-        phone = re.sub(r'[^0-9+]', '', user_message)
-        if len(phone) >= 10:
-            state.phone_number = phone
-            state.last_bot_message = "Спасибо! Сколько человек будет?"
-            state.current_step = "reserve_collect_party"
-        else:
-            attempts = state.increment_attempt("phone")
-            if state.should_handoff("phone"):
-                state.current_step = "handoff"
-                state.handoff_reason = "Failed to collect phone number"
-            else:
-                state.last_bot_message = "Пожалуйста, укажите корректный номер телефона (минимум 10 цифр)."
-        return state
-
-    # Collect party size
-    if state.current_step == "reserve_collect_party" and not state.party_size:
-        try:
-            match = re.search(r'\d+', user_message)
-            if match:
-                party_size = int(match.group())
-                if 1 <= party_size <= 20:
-                    state.party_size = party_size
-                    state.last_bot_message = "Отлично! На какую дату бронируем? (например, 2024-12-30 или завтра)"
-                    state.current_step = "reserve_collect_date"
-                else:
-                    state.last_bot_message = "Мы можем принять группы от 1 до 20 человек. Сколько вас будет?"
-            else:
-                raise ValueError("No number found")
-        except (ValueError, AttributeError):
-            attempts = state.increment_attempt("party_size")
-            if state.should_handoff("party_size"):
-                state.current_step = "handoff"
-                state.handoff_reason = "Failed to collect party size"
-            else:
-                state.last_bot_message = "Пожалуйста, укажите количество гостей числом."
-        return state
-
-    # Collect date
-    if state.current_step == "reserve_collect_date" and not state.reservation_date:
-        try:
-            # Parse date from user input
-            date_str = user_message.strip().lower()
-
-            if "завтра" in date_str or "tomorrow" in date_str:
-                target_date = datetime.now(TIMEZONE) + timedelta(days=1)
-            elif "сегодня" in date_str or "today" in date_str:
-                target_date = datetime.now(TIMEZONE)
-            else:
-                # Try to parse ISO format
-                target_date = datetime.fromisoformat(date_str.split()[0])
-                if target_date.tzinfo is None:
-                    target_date = TIMEZONE.localize(target_date)
-
-            state.reservation_date = target_date.date().isoformat()
-
-            # Find available slots
-            reservation_service = get_reservation_service()
-            available = reservation_service.find_availability(target_date, state.party_size)
-
-            if available:
-                state.available_slots = available[:5]  # Top 5 slots
-                times = ", ".join([slot['time'] for slot in state.available_slots])
-                state.last_bot_message = (
-                    f"На {state.reservation_date} есть свободные места в: {times}. "
-                    f"Какое время вам удобно?"
-                )
-                state.current_step = "reserve_collect_time"
-            else:
-                state.last_bot_message = (
-                    f"К сожалению, на {state.reservation_date} нет свободных мест. "
-                    f"Попробуйте другую дату?"
-                )
-                state.reservation_date = None
-
-        except Exception as e:
-            logger.error(f"Date parsing error: {e}")
-            attempts = state.increment_attempt("date")
-            if state.should_handoff("date"):
-                state.current_step = "handoff"
-                state.handoff_reason = "Failed to collect date"
-            else:
-                state.last_bot_message = "Пожалуйста, укажите дату в формате YYYY-MM-DD или скажите 'завтра'."
+    entry = _COLLECT_HANDLERS.get(state.current_step)
+    if entry is None:
         return state
 
-    # Collect time
-    if state.current_step == "reserve_collect_time" and not state.reservation_time:
-        try:
-            time_str = user_message.strip()
-
-            # Try to find time in HH:MM format
-            time_match = re.search(r'(\d{1,2})[:\.](\d{2})', time_str)
-            if time_match:
-                hour = int(time_match.group(1))
-                minute = int(time_match.group(2))
-                state.reservation_time = f"{hour:02d}:{minute:02d}"
-            else:
-                # Check if it matches one of the available slots
-                for slot in state.available_slots:
-                    if slot['time'] in time_str:
-                        state.reservation_time = slot['time']
-                        break
-
-            if state.reservation_time:
-                state.current_step = "reserve_confirm"
-                state.needs_confirmation = True
-                state.confirmation_pending_for = "reservation"
-                # Will be handled by confirm node
-            else:
-                raise ValueError("Time not found")
-
-        except (ValueError, AttributeError):
-            attempts = state.increment_attempt("time")
-            if state.should_handoff("time"):
-                state.current_step = "handoff"
-                state.handoff_reason = "Failed to collect time"
-            else:
-                state.last_bot_message = "Пожалуйста, укажите время в формате ЧЧ:ММ или выберите из предложенных."
+    slot, handler = entry
+    if getattr(state, slot):
         return state
 
-    return state
+    return handler(state, state.messages[-1])
 
 
 def make_reservation_confirm_node(state: CallState) -> CallState:
@@ -356,7 +414,7 @@ def make_reservation_confirm_node(state: CallState) -> CallState:
     Returns:
         Updated state after confirmation
     """
-    if state.current_step == "reserve_confirm" and state.needs_confirmation:
+    if state.current_step == Step.RESERVE_CONFIRM and state.needs_confirmation:
         # First time in confirm - ask for confirmation
         if state.last_bot_message is None or "подтвердить" not in state.last_bot_message.lower():
             state.last_bot_message = (
@@ -372,15 +430,15 @@ def make_reservation_confirm_node(state: CallState) -> CallState:
 
             if any(word in user_response for word in ["да", "yes", "верно", "правильно", "подтверждаю"]):
                 state.needs_confirmation = False
-                state.current_step = "reserve_execute"
+                state.current_step = Step.RESERVE_EXECUTE
             elif any(word in user_response for word in ["нет", "no", "не верно", "неправильно"]):
                 state.needs_confirmation = False
                 state.reset_for_new_intent()
                 state.current_intent = "RESERVE"
-                state.current_step = "reserve_collect"
+                state.current_step = Step.RESERVE_COLLECT
                 state.last_bot_message = "Хорошо, давайте начнем заново. Как вас зовут?"
             else:
-                state.last_bot_message = "Пожалуйста, ответьте 'да' или 'нет'."
+                state.last_bot_message = _YES_NO_PROMPT
 
     return state
 
@@ -398,12 +456,12 @@ def make_reservation_execute_node(state: CallState) -> CallState:
     reservation_service = get_reservation_service()
 
     try:
-        # Combine date and time
-        reservation_datetime = datetime.fromisoformat(
-            f"{state.reservation_date} {state.reservation_time}"
-        )
-        if reservation_datetime.tzinfo is None:
-            reservation_datetime = TIMEZONE.localize(reservation_datetime)
+        # Assembled once in the time-collection step
+        reservation_datetime = state.reservation_datetime
+        if reservation_datetime is None:
+            reservation_datetime = TIMEZONE.localize(
+                datetime.fromisoformat(f"{state.reservation_date} {state.reservation_time}")
+            )
 
         # Create reservation
         success, reservation, error = reservation_service.create_reservation(
@@ -421,27 +479,78 @@ def make_reservation_execute_node(state: CallState) -> CallState:
                 f"Ждем вас {state.reservation_date} в {state.reservation_time}. "
                 f"Если нужно что-то изменить, позвоните нам!"
             )
-            state.current_step = "reserve_complete"
+            state.current_step = Step.RESERVE_COMPLETE
             state.is_complete = True
-            logger.info(f"Reservation created: {reservation.id}")
+            logger.info("Reservation created: %s", reservation.id)
         else:
             state.last_bot_message = f"К сожалению, не удалось создать бронь: {error}. Попробуем другое время?"
             state.reservation_date = None
             state.reservation_time = None
+            state.reservation_datetime = None
             state.available_slots = []
-            state.current_step = "reserve_collect_date"
+            state.current_step = Step.RESERVE_COLLECT_DATE
 
     except Exception as e:
-        logger.error(f"Error executing reservation: {e}")
+        logger.error("Error executing reservation: %s", e)
         state.last_bot_message = "Извините, произошла ошибка. Давайте попробуем еще раз или я переведу вас на оператора."
         state.error_count += 1
-        state.current_step = "error"
+        state.current_step = Step.ERROR
 
     return state
 
 
 # ==================== Cancel Reservation ====================
 
+def _cancel_collect_name(state: CallState, user_message: str) -> CallState:
+    """Question 1: store the name the reservation was made under."""
+    state.cancel_name = user_message.strip()
+    state.last_bot_message = "На какую дату было бронирование?"
+    state.current_step = Step.CANCEL_COLLECT_DATE
+    return state
+
+
+def _cancel_collect_date(state: CallState, user_message: str) -> CallState:
+    """Question 2: parse and store the reservation date."""
+    try:
+        date_str = user_message.strip().lower()
+
+        if "завтра" in date_str:
+            target_date = (datetime.now(TIMEZONE) + timedelta(days=1)).date()
+        elif "сегодня" in date_str:
+            target_date = datetime.now(TIMEZONE).date()
+        else:
+            target_date = date.fromisoformat(date_str.split()[0])
+
+        state.cancel_date = target_date.isoformat()
+        state.last_bot_message = "И последний вопрос: какой номер телефона или время бронирования?"
+        state.current_step = Step.CANCEL_COLLECT_PHONE_TIME
+
+    except Exception as e:
+        logger.error("Date parsing error: %s", e)
+        attempts = state.increment_attempt("cancel_date")
+        if state.should_handoff("cancel_date"):
+            state.current_step = Step.HANDOFF
+            state.handoff_reason = "Failed to collect cancellation date"
+        else:
+            state.last_bot_message = "Пожалуйста, укажите дату в формате YYYY-MM-DD."
+    return state
+
+
+def _cancel_collect_phone_time(state: CallState, user_message: str) -> CallState:
+    """Question 3: store the phone number or time used to narrow the search."""
+    state.cancel_phone_time = user_message.strip()
+    state.current_step = Step.CANCEL_SEARCH
+    return state
+
+
+# current_step -> (slot that must still be empty, handler)
+_CANCEL_COLLECT_HANDLERS = {
+    Step.CANCEL_COLLECT_NAME: ("cancel_name", _cancel_collect_name),
+    Step.CANCEL_COLLECT_DATE: ("cancel_date", _cancel_collect_date),
+    Step.CANCEL_COLLECT_PHONE_TIME: ("cancel_phone_time", _cancel_collect_phone_time),
+}
+
+
 def cancel_collect_3q_node(state: CallState) -> CallState:
     """
     Collect cancellation info using 3 questions: Name -> Date -> Phone/Time.
@@ -457,50 +566,36 @@ def cancel_collect_3q_node(state: CallState) -> CallState:
     if not state.messages:
         return state
 
-    user_message = state.messages[-1]
+    entry = _CANCEL_COLLECT_HANDLERS.get(state.current_step)
+    if entry is None:
+        return state
 
-    # Question 1: Collect Name
-    if state.current_step == "cancel_collect_name" and not state.cancel_name:
-        state.cancel_name = user_message.strip()
-        state.last_bot_message = "На какую дату было бронирование?"
-        state.current_step = "cancel_collect_date"
+    slot, handler = entry
+    if getattr(state, slot):
         return state
 
-    # Question 2: Collect Date
-    if state.current_step == "cancel_collect_date" and not state.cancel_date:
-        try:
-            date_str = user_message.strip().lower()
+    return handler(state, state.messages[-1])
 
-            if "завтра" in date_str:
-                target_date = datetime.now(TIMEZONE) + timedelta(days=1)
-            elif "сегодня" in date_str:
-                target_date = datetime.now(TIMEZONE)
-            else:
-                target_date = datetime.fromisoformat(date_str.split()[0])
-                if target_date.tzinfo is None:
-                    target_date = TIMEZONE.localize(target_date)
-
-            state.cancel_date = target_date.date().isoformat()
-            state.last_bot_message = "И последний вопрос: какой номер телефона или время бронирования?"
-            state.current_step = "cancel_collect_phone_time"
-
-        except Exception as e:
-            logger.error(f"Date parsing error: {e}")
-            attempts = state.increment_attempt("cancel_date")
-            if state.should_handoff("cancel_date"):
-                state.current_step = "handoff"
-                state.handoff_reason = "Failed to collect cancellation date"
-            else:
-                state.last_bot_message = "Пожалуйста, укажите дату в формате YYYY-MM-DD."
-        return state
 
-    # Question 3: Collect Phone or Time
-    if state.current_step == "cancel_collect_phone_time" and not state.cancel_phone_time:
-        state.cancel_phone_time = user_message.strip()
-        state.current_step = "cancel_search"
-        return state
+def _reservation_display(reservation: Dict[str, Any], key: str, fmt: str) -> str:
+    """
+    Get a display string precomputed by cancel_search_node.
 
-    return state
+    States saved before the string was stored only carry the ISO datetime,
+    so fall back to formatting that.
+
+    Args:
+        reservation: Entry from state.found_reservations
+        key: Precomputed display key
+        fmt: strftime format matching the precomputed string
+
+    Returns:
+        Formatted reservation date and time
+    """
+    display = reservation.get(key)
+    if display is None:
+        display = datetime.fromisoformat(reservation['datetime']).strftime(fmt)
+    return display
 
 
 def cancel_search_node(state: CallState) -> CallState:
@@ -529,6 +624,9 @@ def cancel_search_node(state: CallState) -> CallState:
 
         # Filter by phone or time if provided
         phone_time = state.cancel_phone_time
+        phone_match = parse_phone(phone_time)
+        full_phone = normalize_phone_to_e164(phone_match)[0] if phone_match else None
+        target_time = parse_time(phone_time)
         filtered = []
 
         for res in found:
@@ -536,17 +634,16 @@ def cancel_search_node(state: CallState) -> CallState:
                 continue
 
             # Check if phone or time matches
-            phone_match = re.sub(r'[^0-9+]', '', phone_time)
             if phone_match and phone_match in res.customer_phone:
                 filtered.append(res)
-            else:
-                # Try to match time
-                time_match = re.search(r'(\d{1,2})[:\.](\d{2})', phone_time)
-                if time_match:
-                    target_time = f"{int(time_match.group(1)):02d}:{int(time_match.group(2)):02d}"
-                    res_time = res.datetime.strftime("%H:%M")
-                    if target_time == res_time:
-                        filtered.append(res)
+                # Name + date + full phone is unique; a partial number or a
+                # time may match several bookings, so keep collecting those
+                if target_time is None and res.customer_phone in (phone_match, full_phone):
+                    break
+            elif target_time is not None:
+                target_hour, target_minute = target_time
+                if res.datetime.hour == target_hour and res.datetime.minute == target_minute:
+                    filtered.append(res)
 
         if not filtered:
             # If no match with phone/time filter, use all from name+date
@@ -557,6 +654,8 @@ def cancel_search_node(state: CallState) -> CallState:
                 'id': res.id,
                 'name': res.customer_name,
                 'datetime': res.datetime.isoformat(),
+                'display': f"{res.datetime:%d.%m.%Y %H:%M}",
+                'confirm_display': f"{res.datetime:%d.%m.%Y в %H:%M}",
                 'party_size': res.party_size,
                 'phone': res.customer_phone
             }
@@ -565,22 +664,22 @@ def cancel_search_node(state: CallState) -> CallState:
 
         if not state.found_reservations:
             state.last_bot_message = "Не нашел бронирований с такими данными. Проверьте информацию и попробуйте еще раз."
-            state.current_step = "cancel_not_found"
+            state.current_step = Step.CANCEL_NOT_FOUND
             state.is_complete = True
         elif len(state.found_reservations) == 1:
             # Exactly one found - proceed to confirm
-            state.current_step = "cancel_confirm"
+            state.current_step = Step.CANCEL_CONFIRM
         else:
             # Multiple found - need disambiguation
-            state.current_step = "cancel_disambiguate"
+            state.current_step = Step.CANCEL_DISAMBIGUATE
 
-        logger.info(f"Found {len(state.found_reservations)} reservations for cancellation")
+        logger.info("Found %d reservations for cancellation", len(state.found_reservations))
 
     except Exception as e:
-        logger.error(f"Error searching reservations: {e}")
+        logger.error("Error searching reservations: %s", e)
         state.last_bot_message = "Произошла ошибка при поиске бронирования. Попробуйте еще раз."
         state.error_count += 1
-        state.current_step = "error"
+        state.current_step = Step.ERROR
 
     return state
 
@@ -596,22 +695,23 @@ def cancel_disambiguate_node(state: CallState) -> CallState:
         Updated state after user selects reservation
     """
     if not state.found_reservations:
-        state.current_step = "error"
+        state.current_step = Step.ERROR
         return state
 
     # First time - present options
     if "выберите" not in (state.last_bot_message or "").lower():
         options = []
         for i, res in enumerate(state.found_reservations, 1):
-            dt = datetime.fromisoformat(res['datetime'])
             options.append(
-                f"{i}. {res['name']}, {dt.strftime('%d.%m.%Y %H:%M')}, {res['party_size']} чел."
+                f"{i}. {res['name']}, {_reservation_display(res, 'display', '%d.%m.%Y %H:%M')}, "
+                f"{res['party_size']} чел."
             )
 
-        state.last_bot_message = (
-            f"Нашел несколько бронирований:\n" + "\n".join(options) +
-            f"\nКакое нужно отменить? Назовите номер."
-        )
+        state.last_bot_message = "\n".join([
+            "Нашел несколько бронирований:",
+            *options,
+            "Какое нужно отменить? Назовите номер.",
+        ])
         return state
 
     # User has responded - parse selection
@@ -619,14 +719,14 @@ def cancel_disambiguate_node(state: CallState) -> CallState:
         user_message = state.messages[-1]
         try:
             # Try to extract number
-            match = re.search(r'\d+', user_message)
-            if match:
-                selection = int(match.group()) - 1  # 0-indexed
+            number = parse_int(user_message)
+            if number is not None:
+                selection = number - 1  # 0-indexed
                 if 0 <= selection < len(state.found_reservations):
                     # Keep only the selected reservation
                     selected = state.found_reservations[selection]
                     state.found_reservations = [selected]
-                    state.current_step = "cancel_confirm"
+                    state.current_step = Step.CANCEL_CONFIRM
                 else:
                     state.last_bot_message = f"Пожалуйста, выберите номер от 1 до {len(state.found_reservations)}."
             else:
@@ -634,7 +734,7 @@ def cancel_disambiguate_node(state: CallState) -> CallState:
         except (ValueError, IndexError):
             attempts = state.increment_attempt("disambiguate")
             if state.should_handoff("disambiguate"):
-                state.current_step = "handoff"
+                state.current_step = Step.HANDOFF
                 state.handoff_reason = "Failed to disambiguate reservation"
             else:
                 state.last_bot_message = "Пожалуйста, укажите номер бронирования."
@@ -655,17 +755,17 @@ def cancel_confirm_node(state: CallState) -> CallState:
         Updated state after confirmation
     """
     if not state.found_reservations:
-        state.current_step = "error"
+        state.current_step = Step.ERROR
         return state
 
     reservation = state.found_reservations[0]
 
     # First time in confirm - ask for confirmation
-    if state.current_step == "cancel_confirm" and not state.needs_confirmation:
-        dt = datetime.fromisoformat(reservation['datetime'])
+    if state.current_step == Step.CANCEL_CONFIRM and not state.needs_confirmation:
+        display = _reservation_display(reservation, 'confirm_display', '%d.%m.%Y в %H:%M')
         state.last_bot_message = (
             f"Подтвердите отмену бронирования: {reservation['name']}, "
-            f"{dt.strftime('%d.%m.%Y в %H:%M')}, {reservation['party_size']} человек. "
+            f"{display}, {reservation['party_size']} человек. "
             f"Отменить? (да/нет)"
         )
         state.needs_confirmation = True
@@ -678,14 +778,14 @@ def cancel_confirm_node(state: CallState) -> CallState:
 
         if any(word in user_response for word in ["да", "yes", "отменить", "подтверждаю"]):
             state.needs_confirmation = False
-            state.current_step = "cancel_execute"
+            state.current_step = Step.CANCEL_EXECUTE
         elif any(word in user_response for word in ["нет", "no", "не надо"]):
             state.needs_confirmation = False
             state.last_bot_message = "Хорошо, бронирование сохранено. Могу я помочь с чем-то еще?"
-            state.current_step = "cancel_declined"
+            state.current_step = Step.CANCEL_DECLINED
             state.is_complete = True
         else:
-            state.last_bot_message = "Пожалуйста, ответьте 'да' или 'нет'."
+            state.last_bot_message = _YES_NO_PROMPT
 
     return state
 
@@ -703,7 +803,7 @@ def cancel_execute_node(state: CallState) -> CallState:
     reservation_service = get_reservation_service()
 
     if not state.found_reservations:
-        state.current_step = "error"
+        state.current_step = Step.ERROR
         return state
 
     try:
@@ -720,20 +820,20 @@ def cancel_execute_node(state: CallState) -> CallState:
                 f"Бронирование {reservation_id} успешно отменено. "
                 f"Будем рады видеть вас в другой раз!"
             )
-            state.current_step = "cancel_complete"
+            state.current_step = Step.CANCEL_COMPLETE
             state.is_complete = True
-            logger.info(f"Reservation cancelled: {reservation_id}")
+            logger.info("Reservation cancelled: %s", reservation_id)
         else:
             state.cancellation_result = "failed"
             state.last_bot_message = f"Не удалось отменить бронирование: {error}"
-            state.current_step = "cancel_error"
+            state.current_step = Step.CANCEL_ERROR
             state.is_complete = True
 
     except Exception as e:
-        logger.error(f"Error executing cancellation: {e}")
+        logger.error("Error executing cancellation: %s", e)
         state.last_bot_message = "Произошла ошибка при отмене бронирования. Свяжитесь с нами напрямую."
         state.error_count += 1
-        state.current_step = "error"
+        state.current_step = Step.ERROR
 
     return state
 
@@ -750,12 +850,9 @@ def handoff_node(state: CallState) -> CallState:
     Returns:
         Updated state for handoff
     """
-    state.last_bot_message = (
-        "Сейчас я переведу вас на нашего сотрудника, который сможет лучше помочь. "
-        "Пожалуйста, подождите..."
-    )
-    state.current_step = "handoff_complete"
+    state.last_bot_message = _HANDOFF_MSG
+    state.current_step = Step.HANDOFF_COMPLETE
     state.is_complete = True
 
-    logger.info(f"Handoff initiated. Reason: {state.handoff_reason or 'unknown'}")
+    logger.info("Handoff initiated. Reason: %s", state.handoff_reason or 'unknown')
     return state
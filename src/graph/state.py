@@ -3,14 +3,53 @@ CallState definition for the restaurant bot LangGraph orchestration.
 Matches the spec with slots, messages, attempts, and other required fields.
 """
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 # Intent types for the voice AI bot
 IntentType = Literal["MENU", "RECOMMEND", "RESERVE", "CANCEL", "HANDOFF", "UNKNOWN"]
 
 
+class Step(str, Enum):
+    """
+    Flow steps stored in CallState.current_step.
+
+    Members are str-valued, so comparisons against plain step strings (graph
+    routing, persisted states) keep working, while node code compares against
+    the shared member objects and hits the identity fast path.
+    """
+    GREETING = "greeting"
+    DETECT_INTENT = "detect_intent"
+    MENU_ANSWER = "menu_answer"
+    MENU_ANSWERED = "menu_answered"
+    RECOMMEND = "recommend"
+    RECOMMEND_DONE = "recommend_done"
+    RESERVE_COLLECT = "reserve_collect"
+    RESERVE_COLLECT_PHONE = "reserve_collect_phone"
+    RESERVE_COLLECT_PARTY = "reserve_collect_party"
+    RESERVE_COLLECT_DATE = "reserve_collect_date"
+    RESERVE_COLLECT_TIME = "reserve_collect_time"
+    RESERVE_CONFIRM = "reserve_confirm"
+    RESERVE_EXECUTE = "reserve_execute"
+    RESERVE_COMPLETE = "reserve_complete"
+    CANCEL_COLLECT_NAME = "cancel_collect_name"
+    CANCEL_COLLECT_DATE = "cancel_collect_date"
+    CANCEL_COLLECT_PHONE_TIME = "cancel_collect_phone_time"
+    CANCEL_SEARCH = "cancel_search"
+    CANCEL_DISAMBIGUATE = "cancel_disambiguate"
+    CANCEL_CONFIRM = "cancel_confirm"
+    CANCEL_EXECUTE = "cancel_execute"
+    CANCEL_COMPLETE = "cancel_complete"
+    CANCEL_DECLINED = "cancel_declined"
+    CANCEL_NOT_FOUND = "cancel_not_found"
+    CANCEL_ERROR = "cancel_error"
+    HANDOFF = "handoff"
+    HANDOFF_COMPLETE = "handoff_complete"
+    ERROR = "error"
+
+
 class CallState(BaseModel):
     """
     State management for restaurant bot conversation using LangGraph.
@@ -31,6 +70,7 @@ class CallState(BaseModel):
     party_size: Optional[int] = None
     reservation_date: Optional[str] = None  # ISO format date string (YYYY-MM-DD)
     reservation_time: Optional[str] = None  # Time string (HH:MM)
+    reservation_datetime: Optional[datetime] = None  # Localized date+time, set once time is collected
     special_requests: Optional[str] = None
 
     # Cancellation slots (3 questions: Name -> Date -> Phone/Time)
@@ -43,7 +83,7 @@ class CallState(BaseModel):
     allergens_to_exclude: List[str] = Field(default_factory=list, description="Allergens to avoid")
 
     # ==================== Flow Control ====================
-    current_step: str = Field(default="greeting", description="Current step in the flow")
+    current_step: str = Field(default=Step.GREETING, description="Current step in the flow")
     needs_confirmation: bool = Field(default=False, description="Whether waiting for yes/no confirmation")
     confirmation_pending_for: Optional[str] = Field(None, description="What action needs confirmation")
 
@@ -82,12 +122,12 @@ class CallState(BaseModel):
     is_complete: bool = Field(default=False, description="Whether the call is complete")
     handoff_reason: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-        arbitrary_types_allowed = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @field_serializer("reservation_datetime", "session_start", when_used="json-unless-none")
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize datetimes with datetime.isoformat() in JSON dumps."""
+        return value.isoformat()
 
     def add_message(self, message: str) -> None:
         """Add a message to conversation history."""
@@ -133,6 +173,7 @@ class CallState(BaseModel):
         self.party_size = None
         self.reservation_date = None
         self.reservation_time = None
+        self.reservation_datetime = None
         self.special_requests = None
         self.cancel_name = None
         self.cancel_date = None
@@ -1,14 +1,41 @@
 """Database models for the restaurant reservation system."""
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, create_engine
+from sqlalchemy import DDL, Column, Integer, String, DateTime, Boolean, Index, create_engine, event, text
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
 
+class precise_now(FunctionElement):
+    """Database clock reading with sub-second precision on every backend."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(precise_now)
+def _compile_precise_now(element, compiler, **kw):
+    # Most backends already carry microseconds
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(precise_now, "postgresql")
+def _compile_precise_now_postgresql(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is frozen at transaction start and in the session
+    # time zone; clock_timestamp() advances, and timezone() pins it to UTC
+    return "timezone('utc', clock_timestamp())"
+
+
+@compiles(precise_now, "sqlite")
+def _compile_precise_now_sqlite(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is whole seconds; %f adds milliseconds
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f', 'now'))"
+
+
 class Reservation(Base):
     """Reservation model."""
 
@@ -18,12 +45,33 @@ class Reservation(Base):
     customer_name = Column(String, nullable=False)
     phone_number = Column(String, nullable=False)
     party_size = Column(Integer, nullable=False)
-    reservation_time = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    reservation_time = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, server_default=precise_now())
+    updated_at = Column(DateTime, server_default=precise_now(), onupdate=precise_now())
     cancelled = Column(Boolean, default=False)
     notes = Column(String, nullable=True)
 
+    __table_args__ = (
+        # Cancel flow: active reservations for a caller's phone number
+        Index("ix_reservations_phone_active", "phone_number", "cancelled"),
+        # Capacity checks: cancelled = false AND start < reservation_time < end
+        Index("ix_reservations_cancelled_time", "cancelled", "reservation_time"),
+        # Capacity SUM(party_size) as an index-only scan (PostgreSQL only)
+        Index(
+            "ix_reservations_active_time_covering",
+            "reservation_time",
+            postgresql_include=["party_size"],
+            postgresql_where=text("cancelled = false"),
+        ).ddl_if(dialect="postgresql"),
+        # search_by_name: ILIKE '%name%' via pg_trgm (PostgreSQL only)
+        Index(
+            "ix_reservations_name_trgm",
+            "customer_name",
+            postgresql_using="gin",
+            postgresql_ops={"customer_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self):
         return (
             f"<Reservation(id={self.id}, name='{self.customer_name}', "
@@ -31,6 +79,14 @@ class Reservation(Base):
         )
 
 
+# gin_trgm_ops needs the pg_trgm extension before the reservations indexes exist
+event.listen(
+    Reservation.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 def get_engine(database_url: str = "sqlite:///./restaurant.db"):
     """Create and return database engine."""
     return create_engine(database_url, connect_args={"check_same_thread": False})
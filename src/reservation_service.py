@@ -1,9 +1,12 @@
 """Reservation service for managing restaurant reservations."""
+from bisect import bisect_right
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, delete, lambda_stmt, or_, select, update
+from sqlalchemy.sql import func
 
 from src.models import Reservation
 
@@ -33,6 +36,37 @@ class ReservationService:
         self.db = db_session
         self.max_capacity = max_capacity
         self.table_turnover_minutes = table_turnover_minutes
+        # Set inside batch_mode(): writes are flushed and committed together on exit
+        self._batch = False
+
+    @contextmanager
+    def batch_mode(self) -> Iterator["ReservationService"]:
+        """
+        Group several writes into a single transaction.
+
+        Inside the block, writes are flushed instead of committed. The block
+        is committed once on exit, or rolled back if it raises.
+
+        Yields:
+            This service
+        """
+        self._batch = True
+        try:
+            yield self
+        except Exception:
+            self.db.rollback()
+            raise
+        else:
+            self.db.commit()
+        finally:
+            self._batch = False
+
+    def _commit(self) -> None:
+        """Commit a write, or only flush it inside batch_mode()."""
+        if self._batch:
+            self.db.flush()
+        else:
+            self.db.commit()
 
     def create_reservation(
         self,
@@ -75,7 +109,7 @@ class ReservationService:
         )
 
         self.db.add(reservation)
-        self.db.commit()
+        self._commit()
         self.db.refresh(reservation)
 
         return reservation
@@ -93,7 +127,12 @@ class ReservationService:
         Raises:
             ReservationNotFoundError: If reservation not found
         """
-        reservation = self.db.query(Reservation).filter(Reservation.id == reservation_id).first()
+        reservation = (
+            self.db.query(Reservation)
+            .options(raiseload("*"))
+            .filter(Reservation.id == reservation_id)
+            .first()
+        )
 
         if not reservation:
             raise ReservationNotFoundError(f"Reservation {reservation_id} not found")
@@ -126,35 +165,50 @@ class ReservationService:
         Raises:
             ReservationNotFoundError: If reservation not found
             ReservationConflictError: If update creates a conflict
+            ValueError: If party_size is below 1, or customer_name or
+                phone_number is empty
         """
-        reservation = self.get_reservation(reservation_id)
+        # None means "leave unchanged"; anything else is written as given
+        if party_size is not None and party_size < 1:
+            raise ValueError(f"Party size must be at least 1, got {party_size}")
+        if customer_name is not None and not customer_name.strip():
+            raise ValueError("Customer name cannot be empty")
+        if phone_number is not None and not phone_number.strip():
+            raise ValueError("Phone number cannot be empty")
 
-        # If changing time or party size, check availability
-        new_time = reservation_time if reservation_time else reservation.reservation_time
-        new_size = party_size if party_size else reservation.party_size
+        reservation = self.get_reservation(reservation_id)
 
-        if (reservation_time or party_size) and not self.is_time_available(
-            new_time, new_size, exclude_reservation_id=reservation_id
-        ):
-            raise ReservationConflictError(
-                f"Cannot update reservation: party of {new_size} at {new_time} would exceed capacity"
+        updates = {
+            column: value
+            for column, value in (
+                ("customer_name", customer_name),
+                ("phone_number", phone_number),
+                ("party_size", party_size),
+                ("reservation_time", reservation_time),
+                ("notes", notes),
             )
+            if value is not None
+        }
+        if not updates:
+            return reservation
 
-        # Update fields
-        if customer_name:
-            reservation.customer_name = customer_name
-        if phone_number:
-            reservation.phone_number = phone_number
-        if party_size:
-            reservation.party_size = party_size
-        if reservation_time:
-            reservation.reservation_time = reservation_time
-        if notes is not None:
-            reservation.notes = notes
-
-        reservation.updated_at = datetime.utcnow()
-
-        self.db.commit()
+        # If changing time or party size, check availability
+        if "reservation_time" in updates or "party_size" in updates:
+            new_time = updates.get("reservation_time", reservation.reservation_time)
+            new_size = updates.get("party_size", reservation.party_size)
+            if not self.is_time_available(new_time, new_size, exclude_reservation_id=reservation_id):
+                raise ReservationConflictError(
+                    f"Cannot update reservation: party of {new_size} at {new_time} would exceed capacity"
+                )
+
+        reservation = self.db.execute(
+            update(Reservation)
+            .where(Reservation.id == reservation_id)
+            .values(**updates)
+            .returning(Reservation)
+        ).scalar_one()
+
+        self._commit()
         self.db.refresh(reservation)
 
         return reservation
@@ -172,11 +226,18 @@ class ReservationService:
         Raises:
             ReservationNotFoundError: If reservation not found
         """
-        reservation = self.get_reservation(reservation_id)
-        reservation.cancelled = True
-        reservation.updated_at = datetime.utcnow()
+        # Single UPDATE ... RETURNING instead of SELECT then UPDATE
+        reservation = self.db.execute(
+            update(Reservation)
+            .where(Reservation.id == reservation_id)
+            .values(cancelled=True)
+            .returning(Reservation)
+        ).scalar_one_or_none()
 
-        self.db.commit()
+        if not reservation:
+            raise ReservationNotFoundError(f"Reservation {reservation_id} not found")
+
+        self._commit()
         self.db.refresh(reservation)
 
         return reservation
@@ -191,9 +252,17 @@ class ReservationService:
         Raises:
             ReservationNotFoundError: If reservation not found
         """
-        reservation = self.get_reservation(reservation_id)
-        self.db.delete(reservation)
-        self.db.commit()
+        # Single DELETE ... RETURNING instead of SELECT then DELETE
+        deleted_id = self.db.execute(
+            delete(Reservation)
+            .where(Reservation.id == reservation_id)
+            .returning(Reservation.id)
+        ).scalar_one_or_none()
+
+        if deleted_id is None:
+            raise ReservationNotFoundError(f"Reservation {reservation_id} not found")
+
+        self._commit()
 
     def list_reservations(
         self,
@@ -212,7 +281,7 @@ class ReservationService:
         Returns:
             List of Reservation objects
         """
-        query = self.db.query(Reservation)
+        query = self.db.query(Reservation).options(raiseload("*"))
 
         if not include_cancelled:
             query = query.filter(Reservation.cancelled == False)
@@ -225,6 +294,26 @@ class ReservationService:
 
         return query.order_by(Reservation.reservation_time).all()
 
+    def count_reservations(self, include_cancelled: bool = False, cancelled_only: bool = False) -> int:
+        """
+        Count reservations without loading them.
+
+        Args:
+            include_cancelled: Whether to include cancelled reservations
+            cancelled_only: Count only cancelled reservations (overrides include_cancelled)
+
+        Returns:
+            Number of matching reservations
+        """
+        query = self.db.query(func.count(Reservation.id))
+
+        if cancelled_only:
+            query = query.filter(Reservation.cancelled == True)
+        elif not include_cancelled:
+            query = query.filter(Reservation.cancelled == False)
+
+        return query.scalar()
+
     def is_time_available(
         self,
         reservation_time: datetime,
@@ -242,27 +331,30 @@ class ReservationService:
         Returns:
             True if time is available, False otherwise
         """
-        # Calculate the time window that overlaps with this reservation
+        # Booked capacity is never negative, so an oversized party can't fit
+        if party_size > self.max_capacity:
+            return False
+
+        # A reservation at r occupies [r, r + turnover); it overlaps the requested
+        # [t, t + turnover) exactly when t - turnover < r < t + turnover
         turnover_delta = timedelta(minutes=self.table_turnover_minutes)
         window_start = reservation_time - turnover_delta
         window_end = reservation_time + turnover_delta
 
-        # Find all active reservations that overlap with this time window
-        query = self.db.query(Reservation).filter(
-            and_(
-                Reservation.cancelled == False,
-                Reservation.reservation_time >= window_start,
-                Reservation.reservation_time < window_end,
-            )
+        # Total guests of all active reservations that overlap with this time window.
+        # lambda_stmt caches the constructed and compiled statement; the window
+        # bounds and excluded ID are picked up from the closures as bound parameters
+        stmt = lambda_stmt(lambda: select(func.coalesce(func.sum(Reservation.party_size), 0)))
+        stmt += lambda s: s.where(
+            Reservation.cancelled == False,
+            Reservation.reservation_time > window_start,
+            Reservation.reservation_time < window_end,
         )
 
         if exclude_reservation_id:
-            query = query.filter(Reservation.id != exclude_reservation_id)
-
-        overlapping_reservations = query.all()
+            stmt += lambda s: s.where(Reservation.id != exclude_reservation_id)
 
-        # Calculate total capacity needed during this time
-        current_capacity = sum(r.party_size for r in overlapping_reservations)
+        current_capacity = self.db.execute(stmt).scalar()
 
         return (current_capacity + party_size) <= self.max_capacity
 
@@ -287,40 +379,127 @@ class ReservationService:
         Returns:
             List of available datetime slots
         """
-        available_slots = []
-
-        # Create base date at midnight
         base_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.find_available_slots_bulk(
+            [date], party_size, start_hour, end_hour, slot_interval_minutes
+        )[base_date]
 
-        # Generate time slots
-        current_time = base_date.replace(hour=start_hour)
-        end_time = base_date.replace(hour=end_hour)
+    def find_available_slots_bulk(
+        self,
+        dates: List[datetime],
+        party_size: int,
+        start_hour: int = 17,
+        end_hour: int = 22,
+        slot_interval_minutes: int = 30,
+    ) -> Dict[datetime, List[datetime]]:
+        """
+        Find available time slots for several dates with a single query.
+
+        Args:
+            dates: The dates to search (times will be ignored)
+            party_size: Size of the party
+            start_hour: Start of dining hours (default 5 PM)
+            end_hour: End of dining hours (default 10 PM)
+            slot_interval_minutes: Minutes between slots (default 30)
+
+        Returns:
+            Mapping of each date (at midnight) to its available datetime slots
+        """
+        base_dates = sorted({
+            date.replace(hour=0, minute=0, second=0, microsecond=0) for date in dates
+        })
+        if not base_dates:
+            return {}
+
+        # Load every reservation that can overlap any slot on any date in one
+        # query, then sweep the (t - turnover, t + turnover) window across the
+        # sorted rows; slots are generated in order, so both edges only move
+        # forward within a date
+        turnover_delta = timedelta(minutes=self.table_turnover_minutes)
+        slot_delta = timedelta(minutes=slot_interval_minutes)
+        overlapping = self._load_overlapping(
+            base_dates[0].replace(hour=start_hour) - turnover_delta,
+            base_dates[-1].replace(hour=end_hour) + turnover_delta,
+        )
+        reservation_times = [row[0] for row in overlapping]
+        count = len(overlapping)
+
+        available: Dict[datetime, List[datetime]] = {}
+        for base_date in base_dates:
+            available_slots = []
+            current_time = base_date.replace(hour=start_hour)
+            end_time = base_date.replace(hour=end_hour)
+
+            # Skip rows that end before this date's first slot
+            lo = hi = bisect_right(reservation_times, current_time - turnover_delta)
+            current_capacity = 0
+
+            while current_time <= end_time:
+                window_end = current_time + turnover_delta
+                while hi < count and overlapping[hi][0] < window_end:
+                    current_capacity += overlapping[hi][1]
+                    hi += 1
+
+                window_start = current_time - turnover_delta
+                while lo < hi and overlapping[lo][0] <= window_start:
+                    current_capacity -= overlapping[lo][1]
+                    lo += 1
 
-        while current_time <= end_time:
-            if self.is_time_available(current_time, party_size):
-                available_slots.append(current_time)
+                if current_capacity + party_size <= self.max_capacity:
+                    available_slots.append(current_time)
 
-            current_time += timedelta(minutes=slot_interval_minutes)
+                current_time += slot_delta
 
-        return available_slots
+            available[base_date] = available_slots
 
-    def search_by_phone(self, phone_number: str) -> List[Reservation]:
+        return available
+
+    def _load_overlapping(self, start: datetime, end: datetime) -> List[Tuple[datetime, int]]:
+        """
+        Load active reservations in (start, end) ordered by time.
+
+        Args:
+            start: Start of the window (exclusive)
+            end: End of the window (exclusive)
+
+        Returns:
+            List of (reservation_time, party_size) tuples
+        """
+        return (
+            self.db.query(Reservation.reservation_time, Reservation.party_size)
+            .filter(
+                and_(
+                    Reservation.cancelled == False,
+                    Reservation.reservation_time > start,
+                    Reservation.reservation_time < end,
+                )
+            )
+            .order_by(Reservation.reservation_time)
+            .all()
+        )
+
+    def search_by_phone(self, phone_number: str, active_only: bool = False) -> List[Reservation]:
         """
         Search for reservations by phone number.
 
         Args:
             phone_number: Phone number to search for
+            active_only: Whether to exclude cancelled reservations
 
         Returns:
             List of Reservation objects
         """
-        return (
+        query = (
             self.db.query(Reservation)
+            .options(raiseload("*"))
             .filter(Reservation.phone_number == phone_number)
-            .order_by(Reservation.reservation_time.desc())
-            .all()
         )
 
+        if active_only:
+            query = query.filter(Reservation.cancelled == False)
+
+        return query.order_by(Reservation.reservation_time.desc()).all()
+
     def search_by_name(self, customer_name: str) -> List[Reservation]:
         """
         Search for reservations by customer name (case-insensitive partial match).
@@ -333,6 +512,7 @@ class ReservationService:
         """
         return (
             self.db.query(Reservation)
+            .options(raiseload("*"))
             .filter(Reservation.customer_name.ilike(f"%{customer_name}%"))
             .order_by(Reservation.reservation_time.desc())
             .all()
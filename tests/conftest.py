@@ -1,19 +1,33 @@
 """Pytest configuration and fixtures for restaurant bot tests."""
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from src.models import Base, Reservation
 from src.reservation_service import ReservationService
-from src.graph.nodes import ConversationNodes
-from src.graph.workflow import create_restaurant_bot_graph
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create an in-memory SQLite database engine for testing."""
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    """Create one shared in-memory SQLite database engine for the test run."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; hand control
+    # back to SQLAlchemy so each test can roll back its own commits
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
     yield engine
     engine.dispose()
@@ -21,11 +35,27 @@ def db_engine():
 
 @pytest.fixture(scope="function")
 def db_session(db_engine):
-    """Create a database session for testing."""
-    SessionLocal = sessionmaker(bind=db_engine)
-    session = SessionLocal()
+    """Create a database session whose commits are rolled back after the test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="function")
+def sql_statements(db_engine):
+    """Record the SQL statements executed on the test engine."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", _record)
 
 
 @pytest.fixture(scope="function")
@@ -46,6 +76,24 @@ def sample_reservation_data():
     }
 
 
+@pytest.fixture(scope="function")
+def seed_reservations(db_session):
+    """Factory fixture to insert reservation rows directly, skipping capacity checks."""
+    def _seed(rows):
+        # Rows may set cancelled themselves; default it to active otherwise
+        reservations = [Reservation(**{"cancelled": False, **row}) for row in rows]
+        db_session.add_all(reservations)
+        db_session.commit()
+        return reservations
+    return _seed
+
+
+@pytest.fixture(scope="function")
+def seeded_reservation(seed_reservations, sample_reservation_data):
+    """Insert the sample reservation directly, skipping the create path."""
+    return seed_reservations([sample_reservation_data])[0]
+
+
 @pytest.fixture(scope="function")
 def create_sample_reservation(reservation_service, sample_reservation_data):
     """Factory fixture to create a sample reservation."""
@@ -56,19 +104,7 @@ def create_sample_reservation(reservation_service, sample_reservation_data):
     return _create
 
 
-@pytest.fixture(scope="function")
-def conversation_nodes(reservation_service):
-    """Create conversation nodes instance for testing."""
-    return ConversationNodes(reservation_service)
-
-
-@pytest.fixture(scope="function")
-def restaurant_bot_graph(reservation_service):
-    """Create a compiled restaurant bot graph for testing."""
-    return create_restaurant_bot_graph(reservation_service)
-
-
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def base_time():
     """Provide a base datetime for consistent testing."""
     return datetime(2024, 3, 15, 12, 0)  # Noon on March 15, 2024
@@ -89,20 +125,20 @@ def mock_available_times(base_time):
 
 
 @pytest.fixture(scope="function")
-def populate_reservations(reservation_service, base_time):
+def populate_reservations(seed_reservations, base_time):
     """Factory fixture to populate database with multiple reservations."""
     def _populate(count=5):
-        reservations = []
-        for i in range(count):
-            res = reservation_service.create_reservation(
-                customer_name=f"Customer {i+1}",
-                phone_number=f"555000{i:04d}",
-                party_size=2 + (i % 4),
-                reservation_time=base_time.replace(hour=18) + timedelta(hours=i),
-                notes=f"Test reservation {i+1}",
-            )
-            reservations.append(res)
-        return reservations
+        rows = [
+            {
+                "customer_name": f"Customer {i+1}",
+                "phone_number": f"555000{i:04d}",
+                "party_size": 2 + (i % 4),
+                "reservation_time": base_time.replace(hour=18) + timedelta(hours=i),
+                "notes": f"Test reservation {i+1}",
+            }
+            for i in range(count)
+        ]
+        return seed_reservations(rows)
     return _populate
 
 